@@ -1,12 +1,20 @@
+from __future__ import annotations
+
 import os
+import sys
 import json
-import time
+import pickle
+import signal
+import threading
 import logging
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List
 
-import pandas as pd
-import yfinance as yf
-from colorama import Fore, Style
+# numpy/pandas/yfinance/colorama are imported where used to keep
+# startup (and importing the cache helpers) cheap.
+if TYPE_CHECKING:
+    import pandas as pd
 
 # -----------------------------
 # Configuration
@@ -122,10 +130,17 @@ TICKERS: List[str] = [
 ]
 
 
-SECTOR_CACHE_FILE = "sectors.json"
+# Resolved next to this script, not the working directory: the pickled
+# copy of the cache is loaded with pickle.load (see load_sector_cache)
+SECTOR_CACHE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "sectors.json"
+)
 REFRESH_SECONDS = 10
-DOWNLOAD_PERIOD = "5d"
+DOWNLOAD_LOOKBACK_BDAYS = 1
+FALLBACK_LOOKBACK_BDAYS = 7  # used when the short window spans holidays
 DOWNLOAD_INTERVAL = "1d"
+SECTOR_FETCH_WORKERS = 8
+USE_COLOR = sys.stdout.isatty()  # no ANSI escapes when piped/redirected
 
 logging.basicConfig(
     level=logging.INFO,
@@ -137,31 +152,93 @@ logging.basicConfig(
 # -----------------------------
 # Sector mapping (cached)
 # -----------------------------
+def _pickle_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".pkl"
+
+
+def _write_pickle(pkl_path: str, sectors: Dict[str, str]) -> None:
+    try:
+        with open(pkl_path, "wb") as f:
+            pickle.dump(sectors, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as exc:
+        logging.warning("Failed to write sector cache: %s", exc)
+
+
 def load_sector_cache(path: str) -> Dict[str, str]:
-    if os.path.exists(path):
+    # The pickle is a derived copy of the JSON file; use it only while it is
+    # at least as new as the JSON, so edits to the JSON always win.
+    # pickle.load can run arbitrary code, so the cache directory must be
+    # trusted (only writable by whoever runs the script).
+    pkl_path = _pickle_path(path)
+    json_exists = os.path.exists(path)
+    if os.path.exists(pkl_path) and (
+        not json_exists or os.path.getmtime(pkl_path) >= os.path.getmtime(path)
+    ):
+        try:
+            with open(pkl_path, "rb") as f:
+                data = pickle.load(f)
+            if isinstance(data, dict):
+                logging.info("Loaded sector cache from %s", pkl_path)
+                return data
+        except Exception as exc:
+            logging.warning("Failed to read sector cache: %s", exc)
+    if json_exists:
         try:
             with open(path, "r") as f:
                 data = json.load(f)
             if isinstance(data, dict):
                 logging.info("Loaded sector cache from %s", path)
+                _write_pickle(pkl_path, data)
                 return data
         except Exception as exc:
             logging.warning("Failed to read sector cache: %s", exc)
     return {}
 
 
+@lru_cache(maxsize=None)
+def _session():
+    """Shared HTTP session so refreshes reuse the TLS connection to Yahoo."""
+    # Recent yfinance releases only accept curl_cffi sessions; fall back to
+    # requests for older versions.
+    try:
+        from curl_cffi import requests as http
+
+        return http.Session(impersonate="chrome")
+    except ImportError:
+        import requests as http
+
+        session = http.Session()
+        session.headers["User-Agent"] = "Mozilla/5.0"
+        return session
+
+
+def _fetch_sector(tk: str, session) -> str:
+    import yfinance as yf
+
+    ticker = yf.Ticker(tk, session=session)
+    # fast_info has no sector; get_info() is the explicit accessor on newer
+    # yfinance releases, .info the only one on older ones
+    get_info = getattr(ticker, "get_info", None)
+    info = get_info() if get_info is not None else ticker.info
+    return info.get("sector", "Unknown")
+
+
 def build_sector_cache(tickers: List[str]) -> Dict[str, str]:
     """Fetch sector info once (best effort)."""
     sectors: Dict[str, str] = {}
     logging.info("Building sector cache (one-time fetch)...")
-    for tk in tickers:
-        try:
-            info = yf.Ticker(tk).info  # yfinance still exposes sector here
-            sectors[tk] = info.get("sector", "Unknown")
-        except Exception as exc:
-            sectors[tk] = "Unknown"
-            logging.debug("Sector fetch failed for %s: %s", tk, exc)
-        time.sleep(0.2)  # gentle pacing to avoid rate-limiting
+    # Create the session before the pool starts so every worker shares it
+    session = _session()
+    # Bounded worker count doubles as pacing to avoid rate-limiting
+    with ThreadPoolExecutor(max_workers=SECTOR_FETCH_WORKERS) as ex:
+        futures = {ex.submit(_fetch_sector, tk, session): tk for tk in tickers}
+        for fut in as_completed(futures):
+            tk = futures[fut]
+            try:
+                sectors[tk] = fut.result()
+            except Exception as exc:
+                sectors[tk] = "Unknown"
+                logging.debug("Sector fetch failed for %s: %s", tk, exc)
     return sectors
 
 
@@ -177,91 +254,163 @@ def ensure_sector_cache(path: str, tickers: List[str]) -> Dict[str, str]:
             logging.info("Sector cache updated: %s", path)
         except Exception as exc:
             logging.warning("Failed to write sector cache: %s", exc)
+        _write_pickle(_pickle_path(path), sectors)
     return sectors
 
 
+# -----------------------------
+# Price data
+# -----------------------------
+def download_prices(lookback_bdays: int) -> pd.DataFrame:
+    """Return the Close block (rows=dates, columns=tickers)."""
+    import pandas as pd
+    import yfinance as yf
+    from pandas.tseries.offsets import BDay
+
+    # Explicit start date on the US market calendar day, so Yahoo only
+    # returns the last few business days
+    today = pd.Timestamp.now(tz="America/New_York").normalize()
+    start = (today - lookback_bdays * BDay()).strftime("%Y-%m-%d")
+    data = yf.download(
+        TICKERS,
+        start=start,
+        interval=DOWNLOAD_INTERVAL,
+        threads=True,
+        progress=False,
+        actions=False,
+        group_by="column",
+        session=_session(),
+    )
+    if data is None or data.empty:
+        return data
+    # Drop Open/High/Low/Volume right away; only Close is used
+    return data["Close"]
+
+
 # -----------------------------
 # Display helpers
 # -----------------------------
 def print_sector_block(df: pd.DataFrame, sector: str) -> None:
-    print(f"\nSector: {sector}")
-    print(f"{'Ticker':<6} {'Prev':>10} {'Cur':>10} {'%Chg':>8}")
-    for _, r in df.iterrows():
-        color = (
-            Fore.GREEN
-            if r["% Change"] > 0
-            else Fore.RED if r["% Change"] < 0 else Fore.LIGHTBLACK_EX
+    lines = [
+        f"\nSector: {sector}",
+        f"{'Ticker':<6} {'Prev':>10} {'Cur':>10} {'%Chg':>8}",
+    ]
+    tickers = df["Ticker"].to_numpy()
+    prevs = df["Previous"].to_numpy()
+    curs = df["Current"].to_numpy()
+    chgs = df["% Change"].to_numpy()
+    if USE_COLOR:
+        import numpy as np
+        from colorama import Fore, Style
+
+        colors = (Fore.RED, Fore.LIGHTBLACK_EX, Fore.GREEN)
+        reset = Style.RESET_ALL
+        # sign(chg) + 1 indexes colors: 0 = down, 1 = flat, 2 = up
+        signs = np.sign(chgs).astype(np.int8) + 1
+        lines.extend(
+            f"{tk:<6} {prev:>10.2f} {cur:>10.2f} {colors[sg]}{chg:>7.2f}%{reset}"
+            for tk, prev, cur, chg, sg in zip(tickers, prevs, curs, chgs, signs)
         )
-        print(
-            f"{r['Ticker']:<6} "
-            f"{r['Previous']:>10.2f} "
-            f"{r['Current']:>10.2f} "
-            f"{color}{r['% Change']:>7.2f}%{Style.RESET_ALL}"
+    else:
+        lines.extend(
+            f"{tk:<6} {prev:>10.2f} {cur:>10.2f} {chg:>7.2f}%"
+            for tk, prev, cur, chg in zip(tickers, prevs, curs, chgs)
         )
+    # One write per block instead of one print per row
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # -----------------------------
 # Main loop
 # -----------------------------
+STOP = threading.Event()
+
+
+def _request_stop(signum, frame) -> None:
+    STOP.set()
+    # Restore the default so a second signal kills an in-flight download
+    default = signal.default_int_handler if signum == signal.SIGINT else signal.SIG_DFL
+    signal.signal(signum, default)
+
+
 def main() -> None:
+    import colorama
+    import numpy as np
+    import pandas as pd
+
+    colorama.init(strip=not USE_COLOR)
+
     sectors = ensure_sector_cache(SECTOR_CACHE_FILE, TICKERS)
 
-    while True:
+    # Installed after the startup fetch so Ctrl-C still aborts it directly.
+    # From here on, Ctrl-C / SIGTERM wake the refresh wait immediately.
+    signal.signal(signal.SIGINT, _request_stop)
+    signal.signal(signal.SIGTERM, _request_stop)
+
+    # Sector mapping is fixed after startup; build display lookups once
+    ticker_sectors = {tk: sectors.get(tk, "Unknown") for tk in TICKERS}
+    sector_order = sorted(set(ticker_sectors.values()))
+    tickers_by_sector = {
+        s: [tk for tk, v in ticker_sectors.items() if v == s] for s in sector_order
+    }
+
+    while not STOP.is_set():
         logging.info("Fetching price data...")
         try:
-            data = yf.download(
-                TICKERS,
-                period=DOWNLOAD_PERIOD,
-                interval=DOWNLOAD_INTERVAL,
-                threads=True,
-                progress=False,
-            )
+            data = download_prices(DOWNLOAD_LOOKBACK_BDAYS)
+            if data is not None and len(data) < 2:
+                logging.info(
+                    "Short history returned, retrying with %s business days",
+                    FALLBACK_LOOKBACK_BDAYS,
+                )
+                data = download_prices(FALLBACK_LOOKBACK_BDAYS)
 
             if data is None or data.empty:
                 raise ValueError("No data returned from Yahoo Finance")
 
-            # Build results
-            results = []
-            for tk in TICKERS:
-                try:
-                    s = data["Close"][tk].dropna()
-                    if len(s) < 2:
-                        raise ValueError("Insufficient history")
-                    prev, current = s.iloc[-2], s.iloc[-1]
-                    change = (current - prev) / prev * 100.0
-                    results.append(
-                        {
-                            "Ticker": tk,
-                            "Sector": sectors.get(tk, "Unknown"),
-                            "Previous": prev,
-                            "Current": current,
-                            "% Change": change,
-                        }
-                    )
-                except Exception as exc:
-                    results.append(
-                        {
-                            "Ticker": tk,
-                            "Sector": sectors.get(tk, "Unknown"),
-                            "Previous": None,
-                            "Current": None,
-                            "% Change": None,
-                            "Error": str(exc),
-                        }
-                    )
+            # Build results (vectorized over the Close block)
+            close = data.reindex(columns=TICKERS)
+            close_np = close.to_numpy(dtype=np.float32)
+            if close_np.shape[0] < 2:
+                raise ValueError("Insufficient history returned")
+            present = ~np.isnan(close_np)
+            # Stable sort puts each ticker's valid rows last, in date order
+            pos = np.argsort(present, axis=0, kind="stable")
+            current = np.take_along_axis(close_np, pos[-1:], axis=0)[0]
+            prev = np.take_along_axis(close_np, pos[-2:-1], axis=0)[0]
+            insufficient = present.sum(axis=0) < 2
+            change = (current / prev - 1.0) * 100.0
+
+            # Split at source: only tickers with two closes reach pandas
+            ok = ~insufficient
+            valid = pd.DataFrame(
+                {
+                    "Ticker": close.columns[ok],
+                    "Previous": prev[ok],
+                    "Current": current[ok],
+                    "% Change": change[ok],
+                },
+                columns=["Ticker", "Previous", "Current", "% Change"],
+            )
+            errs = [
+                {"Ticker": tk, "Error": "Insufficient history"}
+                for tk in close.columns[insufficient]
+            ]
 
             # Display
-            valid = pd.DataFrame(results).dropna(subset=["% Change"])
             if valid.empty:
                 logging.warning("No valid symbols to display.")
             else:
                 valid = valid.sort_values(by="% Change", ascending=False)
+                valid = valid.set_index("Ticker", drop=False)
                 print("\nPrice Change — Close vs Previous Close")
-                for sector in sorted(valid["Sector"].unique()):
-                    print_sector_block(valid[valid["Sector"] == sector], sector)
+                for sector in sector_order:
+                    # intersection keeps the % Change ordering of valid
+                    idx = valid.index.intersection(tickers_by_sector[sector])
+                    if len(idx):
+                        print_sector_block(valid.loc[idx], sector)
 
             # Errors (if any)
-            errs = [r for r in results if r.get("Error")]
             if errs:
                 print("\nErrors:")
                 for r in errs:
@@ -271,7 +420,7 @@ def main() -> None:
             logging.error("Fetch/display error: %s", exc)
 
         logging.info("Sleeping %s seconds...", REFRESH_SECONDS)
-        time.sleep(REFRESH_SECONDS)
+        STOP.wait(REFRESH_SECONDS)
 
 
 if __name__ == "__main__":